@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+from itertools import repeat
 from typing import Literal, Type, Optional, Callable
 
 import cloca
@@ -82,6 +83,8 @@ class App(Base):
         self.__has_resumed_once: bool = False
         # remained length of application threads
         self._remained: list[int, ...] = list(self.LENGTH)
+        # reusable buffer for consumed cycles, sized on demand in resume()
+        self._consumed: list[int, ...] = []
 
     def has_resumed_once(self) -> bool:
         """
@@ -113,22 +116,38 @@ class App(Base):
         Returns
         -------
         list[int, ...]
-            List of consumed cycles for each core.
+            List of consumed cycles for each core. The list is a per-app buffer
+            reused by subsequent calls; copy it if it must outlive the next resume.
         """
         num_cores = len(cpu)
         num_threads = len(self._remained)
-        remaining_cycles = list(cpu)
-        consumed_cycles = [0] * num_cores
+        # Reuse the consumed-cycles buffer to avoid a list allocation per tick.
+        if len(self._consumed) != num_cores:
+            self._consumed = [0] * num_cores
+        else:
+            self._consumed[:] = repeat(0, num_cores)
+        consumed_cycles = self._consumed
 
         if not self.__has_resumed_once:
             self.__has_resumed_once = True
 
+        # Apart from the remaining work, the stop conditions are constant within
+        # a call; check them once instead of on every inner iteration.
+        if self.is_stopped():
+            return consumed_cycles
+
+        # Track the total remaining work so the stop condition is an int compare.
+        remained = self._remained
+        total_remained = sum(remained)
+
         thread_idx = 0
         for core_idx in range(num_cores):
-            while remaining_cycles[core_idx] > 0 and not self.is_stopped():
-                cycles_to_spend = min(remaining_cycles[core_idx], self._remained[thread_idx])
-                self._remained[thread_idx] -= cycles_to_spend
-                remaining_cycles[core_idx] -= cycles_to_spend
+            core_budget = cpu[core_idx]
+            while core_budget > 0 and total_remained > 0:
+                cycles_to_spend = min(core_budget, remained[thread_idx])
+                remained[thread_idx] -= cycles_to_spend
+                core_budget -= cycles_to_spend
+                total_remained -= cycles_to_spend
                 consumed_cycles[core_idx] += cycles_to_spend
                 thread_idx = (thread_idx + 1) % num_threads
 
@@ -185,9 +204,9 @@ class Controller(App):
         list of cluster nodes
     """
     NODES: list[Vm, ...]
-    CONTROL_PLANE: Type[policy.ControlPlane]
+    CONTROL_PLANE: InitVar[Type[policy.ControlPlane]]
 
-    def __post_init__(self):
+    def __post_init__(self, CONTROL_PLANE: Type[policy.ControlPlane]):
         """
         Perform post-initialization steps for the object.
 
@@ -199,7 +218,8 @@ class Controller(App):
         # A worker service is scheduled on the worker nodes
         for node in self.NODES:
             node.OS.schedule([App(NAME='worker', LENGTH=self.LENGTH)])
-        self.CONTROL_PLANE = self.CONTROL_PLANE(self)
+        # The control plane class is instantiated once; the attribute always holds the instance.
+        self.CONTROL_PLANE: policy.ControlPlane = CONTROL_PLANE(self)
 
     def resume(self, cpu: tuple[int, ...]) -> list[int, ...]:
         """
@@ -286,6 +306,7 @@ class Deployment(Base):
         -------
         Iterator[Container]
             An iterator yielding the Container specs in the 'CONTAINER_SPECS' list.
+            The specs are plain dicts, never dict subclasses.
         """
         return iter(self.CONTAINER_SPECS)
 
@@ -314,19 +335,20 @@ class Vm(Base):
     CPU: int
     RAM: int
     GPU: Optional[tuple[int, int]]
-    OS: Type[policy.Os]
+    OS: InitVar[Type[policy.Os]]
 
     STATE_ON = 'ON'
     STATE_OFF = 'OFF'
 
     state: Literal[STATE_ON, STATE_OFF] = field(init=False, default=STATE_OFF)
 
-    def __post_init__(self):
+    def __post_init__(self, OS: Type[policy.Os]):
         """
         The __post_init__ function is a special function that runs after the object has been initialized. It allows
         us to do some additional setup on our objects, like setting up attributes that depend on other attributes.
         """
-        self.OS = self.OS(self)
+        # The operating system class is instantiated once; the attribute always holds the instance.
+        self.OS: policy.Os = OS(self)
 
     def turn_on(self) -> Vm:
         """
@@ -385,15 +407,16 @@ class Pm(Base):
     CPU: tuple[int, ...]
     RAM: int
     GPU: Optional[tuple[tuple[int, int], ...]]
-    VMM: Type[policy.Vmm]
+    VMM: InitVar[Type[policy.Vmm]]
 
-    def __post_init__(self):
+    def __post_init__(self, VMM: Type[policy.Vmm]):
         """
         The __post_init__ function is called after the object has been initialized.
         This allows you to do some post-initialization processing, without having to
         call a separate function (which would require you to pass in all the arguments).
         """
-        self.VMM = self.VMM(self)
+        # The hypervisor class is instantiated once; the attribute always holds the instance.
+        self.VMM: policy.Vmm = VMM(self)
 
 
 @dataclass(kw_only=True)
@@ -411,30 +434,57 @@ class DataCenter(Base):
         management utility which determines assignment of virtual machines to physical machines
     """
     NAME: str
-    VMP: Type[policy.Vmp]
+    VMP: InitVar[Type[policy.Vmp]]
     HOSTS: list[Pm, ...] = field(default_factory=list)
 
-    def __post_init__(self):
+    def __post_init__(self, VMP: Type[policy.Vmp]):
         """
         The __post_init__ function is called after the object has been initialized.
         It allows additional initialization steps that require access to the instance, e.g.:
-            def __post_init__(self):
-                self.VMP = self.VMP(self)
+            def __post_init__(self, VMP):
+                self.VMP = VMP(self)
         """
-        self.VMP = self.VMP(self)
+        # The placement class is instantiated once; the attribute always holds the instance.
+        self.VMP: policy.Vmp = VMP(self)
 
     def __iter__(self):
         """
         Return an iterator for the object.
 
         This method allows the object to be iterable, and it returns an iterator over the
-        hosts in the data center.
+        hosts in the data center. The underlying list iterator is returned directly to
+        avoid an extra builtin lookup on this frequently used path.
 
         Returns
         -------
             An iterator over the hosts in the data center.
         """
-        return iter(self.HOSTS)
+        return self.HOSTS.__iter__()
+
+    def __len__(self) -> int:
+        """
+        Return the number of hosts in the data center.
+
+        Returns
+        -------
+            The number of hosts in the data center.
+        """
+        return len(self.HOSTS)
+
+    def __getitem__(self, index: int) -> Pm:
+        """
+        Retrieve a host of the data center by index.
+
+        Parameters
+        ----------
+        index : int
+            index of the host
+
+        Returns
+        -------
+            The host at the given index.
+        """
+        return self.HOSTS[index]
 
 
 @dataclass(kw_only=True)
@@ -457,13 +507,39 @@ class User(Base):
         Return an iterator for the object.
 
         This method allows the object to be iterable, and it returns an iterator over the
-        requests of the user.
+        requests of the user. The underlying list iterator is returned directly to
+        avoid an extra builtin lookup on this frequently used path.
 
         Returns
         -------
             An iterator over the requests of the user.
         """
-        return iter(self.REQUESTS)
+        return self.REQUESTS.__iter__()
+
+    def __len__(self) -> int:
+        """
+        Return the number of requests of the user.
+
+        Returns
+        -------
+            The number of requests of the user.
+        """
+        return len(self.REQUESTS)
+
+    def __getitem__(self, index: int) -> Action:
+        """
+        Retrieve a request of the user by index.
+
+        Parameters
+        ----------
+        index : int
+            index of the request
+
+        Returns
+        -------
+            The request at the given index.
+        """
+        return self.REQUESTS[index]
 
 
 @dataclass(kw_only=True)
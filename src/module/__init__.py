@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from itertools import groupby
-from typing import Callable
+from typing import Callable, Iterator, Optional
 
 import cloca
 import evque
@@ -13,30 +13,83 @@ import model
 from model import Request
 
 
-@dataclass
+def _is_request(item) -> bool:
+    """Return True when the given simulation element is a Request."""
+    return isinstance(item, Request)
+
+
+# Log-line suffixes looked up by (REQUIRED, IGNORED) instead of two ternaries per request.
+_TAGS: dict[tuple[bool, bool], str] = {
+    (False, False): '',
+    (True, False): ' [REQUIRED]',
+    (False, True): ' [IGNORED]',
+    (True, True): ' [REQUIRED] [IGNORED]'
+}
+
+
+@dataclass(slots=True)
 class Tracker:
     """Tracks request labels: arrived, accepted, and rejected."""
 
-    _requests: dict[str, list[Request]] = field(default_factory=lambda: {
-        'arrived': [],
-        'accepted': [],
-        'rejected': []
-    })
+    arrived: list[Request] = field(default_factory=list)
+    accepted: list[Request] = field(default_factory=list)
+    rejected: list[Request] = field(default_factory=list)
+    # Running counts kept alongside the lists so per-tick consumers such as
+    # has_pending() compare plain ints instead of taking list lengths.
+    _num_arrived: int = field(init=False, default=0)
+    _num_accepted: int = field(init=False, default=0)
+    _num_rejected: int = field(init=False, default=0)
 
     def reset(self) -> Tracker:
         """Reset the request lists."""
-        for key in self._requests:
-            self._requests[key].clear()
+        self.arrived.clear()
+        self.accepted.clear()
+        self.rejected.clear()
+        self._num_arrived = self._num_accepted = self._num_rejected = 0
         return self
 
-    def record(self, label: str, requests: list[Request]) -> Tracker:
+    def record_arrived(self, requests: list[Request]) -> Tracker:
         """
-        Add a list of requests to the specified label list.
+        Record a list of requests as arrived.
+
+        Parameters
+        ----------
+        requests : List[Request]
+            The list of request instances to be recorded.
+
+        Returns
+        -------
+        Tracker
+            Updated tracker instance.
+        """
+        self.arrived.extend(requests)
+        self._num_arrived += len(requests)
+        return self
+
+    def record_accepted(self, requests: list[Request]) -> Tracker:
+        """
+        Record a list of requests as accepted.
+
+        Parameters
+        ----------
+        requests : List[Request]
+            The list of request instances to be recorded.
+
+        Returns
+        -------
+        Tracker
+            Updated tracker instance.
+        """
+        self.accepted.extend(requests)
+        self._num_accepted += len(requests)
+        return self
+
+    def record_rejected(self, requests: list[Request]) -> Tracker:
+        """
+        Record a list of requests as rejected.
 
         Parameters
         ----------
-        label : str
-            Label type ('arrived', 'accepted', 'rejected').
         requests : List[Request]
             The list of request instances to be recorded.
 
@@ -45,19 +98,19 @@ class Tracker:
         Tracker
             Updated tracker instance.
         """
-        if label in self._requests:
-            self._requests[label].extend(requests)
+        self.rejected.extend(requests)
+        self._num_rejected += len(requests)
         return self
 
     def has_pending(self) -> bool:
         """Check if there are any pending requests."""
-        return len(self._requests['arrived']) > (len(self._requests['accepted']) + len(self._requests['rejected']))
+        return self._num_arrived > (self._num_accepted + self._num_rejected)
 
     def stats(self) -> dict[str, dict[str, float]]:
         """Retrieve counts and ratios of requests."""
-        arrived_requests = len(self._requests['arrived'])
-        accepted_count = len(self._requests['accepted'])
-        rejected_count = len(self._requests['rejected'])
+        arrived_requests = self._num_arrived
+        accepted_count = self._num_accepted
+        rejected_count = self._num_rejected
         pending_count = arrived_requests - accepted_count - rejected_count
 
         if arrived_requests == 0:
@@ -95,10 +148,16 @@ class Tracker:
         List[Request]
             List of request instances for the specified label.
         """
-        return self._requests.get(label, [])
+        if label == 'arrived':
+            return self.arrived
+        elif label == 'accepted':
+            return self.accepted
+        elif label == 'rejected':
+            return self.rejected
+        return []
 
 
-@dataclass
+@dataclass(slots=True)
 class Simulation:
     """
     This class represents a simulation.
@@ -121,6 +180,14 @@ class Simulation:
     DATACENTER: model.DataCenter
     CLOCK_RESOLUTION: int = field(default=1)
     LOG: bool = True
+    # Declared for the slots layout; all are assigned in __post_init__.
+    tracker: Tracker = field(init=False)
+    _current_tick: int = field(init=False)
+    _immediate_handlers: dict[str, Callable] = field(init=False)
+    _pending_arrivals: Iterator[tuple[int, list[model.Action, ...]]] = field(init=False)
+    _next_arrival: Optional[tuple[int, list[model.Action, ...]]] = field(init=False)
+    _accept_buf: list[model.Request, ...] = field(init=False)
+    _reject_buf: list[model.Request, ...] = field(init=False)
 
     def __post_init__(self):
         """
@@ -133,14 +200,16 @@ class Simulation:
         self.tracker: Tracker = Tracker()
         # Reset global simulation clock.
         cloca.reset()
+        # Cached copy of the simulation clock, refreshed once per step. Event handlers
+        # read this attribute instead of polling `cloca.now()` per publish call.
+        self._current_tick: int = cloca.now()
 
         # Subscribe to event topics
         for topic, handler in [
             ('request.arrive', self._handle_request_arrive),
-            ('request.accept', self._handle_request_accept),
-            ('request.reject', self._handle_request_reject),
             ('action.execute', self._handle_action_execute),
             ('sim.log', self._handle_simulation_log),
+            ('sim.log.batch', self._handle_simulation_log_batch),
         ]:
             evque.subscribe(topic, handler)
 
@@ -161,10 +230,27 @@ class Simulation:
         ]:
             evque.subscribe(topic, self._create_log_formatter(message_suffix))
 
-        # Group incoming requests by their arrival time
-        for arrival, requests in groupby(self.USER.REQUESTS, key=lambda r: r.ARRIVAL):
-            # Publish an event to signal the arrival of requests with the same arrival time.
-            evque.publish('request.arrive', arrival, list(requests))
+        # Topics owned solely by this simulation and always published for the
+        # current tick; these bypass the event queue via _dispatch. Log topics
+        # stay queued so printed output keeps its event ordering.
+        self._immediate_handlers = {
+            'action.execute': self._handle_action_execute,
+        }
+
+        # Reusable buffers for per-arrival allocation outcomes; the settlement
+        # handler consumes their contents without retaining the lists.
+        self._accept_buf = []
+        self._reject_buf = []
+
+        # Group incoming requests by their arrival time. A single bucketing pass keeps
+        # grouping correct even when the requests are not sorted by arrival time.
+        arrival_buckets: dict[int, list[model.Action]] = {}
+        for request in self.USER.REQUESTS:
+            arrival_buckets.setdefault(request.ARRIVAL, []).append(request)
+        # Arrivals are streamed into the event queue step by step rather than
+        # materialized up front; only the next group is held at any time.
+        self._pending_arrivals = iter(sorted(arrival_buckets.items()))
+        self._next_arrival = next(self._pending_arrivals, None)
 
     def report(self, to_stdout=True) -> dict[str, float]:
         """
@@ -196,16 +282,17 @@ class Simulation:
             'accepted': counts['accepted'],
             'rejected': counts['rejected'],
             'pending': counts['pending'],
-            'acceptance_ratio': round(ratios['accepted_ratio'], 2),
-            'rejection_ratio': round(ratios['rejected_ratio'], 2),
-            'pending_ratio': round(ratios['pending_ratio'], 2)
+            'acceptance_ratio': ratios['accepted_ratio'],
+            'rejection_ratio': ratios['rejected_ratio'],
+            'pending_ratio': ratios['pending_ratio']
         }
 
         if to_stdout:
+            # Rounding happens only at display time; returned ratios stay exact.
             current_time = cloca.now()
-            print(f'{self.NAME}@{current_time}> Accept[{result["accepted"]} / {result["arrived"]}] = {result["acceptance_ratio"]}')
-            print(f'{self.NAME}@{current_time}> Reject[{result["rejected"]} / {result["arrived"]}] = {result["rejection_ratio"]}')
-            print(f'{self.NAME}@{current_time}> Pending[{result["pending"]} / {result["arrived"]}] = {result["pending_ratio"]}')
+            print(f'{self.NAME}@{current_time}> Accept[{result["accepted"]} / {result["arrived"]}] = {round(result["acceptance_ratio"], 2)}')
+            print(f'{self.NAME}@{current_time}> Reject[{result["rejected"]} / {result["arrived"]}] = {round(result["rejection_ratio"], 2)}')
+            print(f'{self.NAME}@{current_time}> Pending[{result["pending"]} / {result["arrived"]}] = {round(result["pending_ratio"], 2)}')
 
         return result
 
@@ -224,16 +311,19 @@ class Simulation:
         """
         print(f'{self.NAME}@{cloca.now()}> ======== START ========')
 
-        # Define the exit condition based on whether a duration is provided
-        has_duration_elapsed = lambda start_time=cloca.now(): cloca.now() >= start_time + duration if duration else False
-        should_exit = has_duration_elapsed if duration else self.completed
+        # Bind the step method once so the loops avoid a per-tick attribute lookup.
+        step = self._simulate_step
 
-        while not should_exit():
-            self._simulate_step()
-
-        if has_duration_elapsed():
+        # Pick the exit condition up front instead of re-checking `duration` per tick.
+        if duration:
+            deadline = cloca.now() + duration
+            while cloca.now() < deadline:
+                step()
             print(f'{self.NAME}@{cloca.now()}> -------- PAUSE --------')
         else:
+            completed = self.completed
+            while not completed():
+                step()
             print(f'{self.NAME}@{cloca.now()}> ======== STOP ========')
         return self
 
@@ -248,19 +338,33 @@ class Simulation:
             4. Advances the simulation clock.
         """
 
+        # Fetch the clock once per step and cache it for event handlers.
+        now = cloca.now()
+        self._current_tick = now
+
+        # Publish the arrival groups that are due by now.
+        while self._next_arrival and self._next_arrival[0] <= now:
+            arrival, arrivals = self._next_arrival
+            evque.publish('request.arrive', arrival, arrivals)
+            self._next_arrival = next(self._pending_arrivals, None)
+
         # Execute events for the current simulation time
-        evque.run_until(cloca.now())
+        evque.run_until(now)
+
+        # Resolve the placement policy once for the calls below.
+        vmp = self.DATACENTER.VMP
 
         # Resume VMs in the data center
-        self.DATACENTER.VMP.resume(self.CLOCK_RESOLUTION)
+        vmp.resume(self.CLOCK_RESOLUTION)
 
         # Collect and deallocate stopped VMs
-        stopped_vms = self.DATACENTER.VMP.stopped()
+        stopped_vms = vmp.stopped()
         if stopped_vms:
-            self.DATACENTER.VMP.deallocate(stopped_vms)
+            vmp.deallocate(stopped_vms)
 
         # Advance the simulation clock
         cloca.increase(self.CLOCK_RESOLUTION)
+        self._current_tick = cloca.now()
 
     def completed(self) -> bool:
         """
@@ -274,7 +378,7 @@ class Simulation:
         bool
             True if the simulation is complete, False otherwise.
         """
-        return evque.empty() and not self.tracker.has_pending() and self.DATACENTER.VMP.empty()
+        return self._next_arrival is None and evque.empty() and not self.tracker.has_pending() and self.DATACENTER.VMP.empty()
 
     def _handle_request_arrive(self, requests: list[model.Request, ...]) -> Simulation:
         """
@@ -286,21 +390,30 @@ class Simulation:
             List of incoming requests.
         """
 
-        requests = [r for r in requests if isinstance(r, model.Request)]
-        self.tracker.record('arrived', [r for r in requests if not r.IGNORED])
-        for request in requests:
-            required_tag = ' [REQUIRED]' if request.REQUIRED else ''
-            ignored_tag = ' [IGNORED]' if request.IGNORED else ''
-            evque.publish('sim.log', cloca.now(), f'arrive {request.VM.NAME}' + required_tag + ignored_tag)
+        # Bind hot globals and attributes to locals for the per-request loop.
+        now, publish = self._current_tick, evque.publish
 
-        allocations = self.DATACENTER.VMP.allocate([r.VM for r in requests if isinstance(r, model.Request)])
+        items, requests, non_ignored = requests, [], []
+        for request in items:
+            if _is_request(request):
+                requests.append(request)
+                if not request.IGNORED:
+                    non_ignored.append(request)
+        self.tracker.record_arrived(non_ignored)
+        if self.LOG and requests:
+            lines = [f'arrive {r.VM.NAME}{_TAGS[r.REQUIRED, r.IGNORED]}' for r in requests]
+            publish('sim.log.batch', now, lines)
 
-        # Initialize lists for publishing results
-        accepted_requests = []
-        rejected_requests = []
+        allocations = self.DATACENTER.VMP.allocate([r.VM for r in requests])
+
+        # Reset the pooled outcome buffers for this arrival event
+        accepted_requests = self._accept_buf
+        rejected_requests = self._reject_buf
+        accepted_requests.clear()
+        rejected_requests.clear()
 
         # Check allocation results, handle callbacks, and update counters
-        for request, allocated in zip(filter(lambda r: isinstance(r, model.Request), requests), allocations):
+        for request, allocated in zip(requests, allocations):
             if allocated:
                 accepted_requests.append(request)
                 if request.ON_SUCCESS:
@@ -312,63 +425,39 @@ class Simulation:
                 if request.ON_FAILURE:
                     request.ON_FAILURE()
 
-        # Publish allocation results
-        evque.publish('request.accept', cloca.now(), accepted_requests)
-        evque.publish('request.reject', cloca.now(), rejected_requests)
+        # Record and log the settlement outcomes in the same pass
+        self.tracker.record_accepted([r for r in accepted_requests if not r.IGNORED])
+        self.tracker.record_rejected([r for r in rejected_requests if not r.IGNORED])
+        if self.LOG:
+            lines = [f'accept {r.VM.NAME}{_TAGS[r.REQUIRED, r.IGNORED]}' for r in accepted_requests]
+            lines += [f'reject {r.VM.NAME}{_TAGS[r.REQUIRED, r.IGNORED]}' for r in rejected_requests]
+            if lines:
+                publish('sim.log.batch', now, lines)
 
-        evque.publish('action.execute', cloca.now(), requests)
+        # Only actions that carry a callable are worth delivering.
+        self._dispatch('action.execute', [r for r in requests if r.EXECUTE])
 
         return self
 
-    def _handle_request_accept(self, requests):
+    def _dispatch(self, topic: str, *args) -> None:
         """
-        Handle the acceptance of requests by recording the event and publishing a log.
+        Deliver an event for the current tick.
 
-        This method iterates over each request, records it as 'accepted' if it's not ignored,
-        and publishes an acceptance log with the request's virtual machine name and any
-        required or ignored flags.
+        Self-owned immediate topics are handled with a direct call, skipping the
+        event-queue round trip; any other topic falls back to `evque.publish`.
 
         Parameters
         ----------
-        requests : list
-            A list of request objects to be processed.
-
-        See Also
-        --------
-        _tracker.record : Method used to record the number of accepted requests.
-        evque.publish : Method used to publish an event to the event queue.
-        """
-        requests = [r for r in requests if isinstance(r, model.Request)]
-        self.tracker.record('accepted', [r for r in requests if not r.IGNORED])
-        for request in requests:
-            required_tag = ' [REQUIRED]' if request.REQUIRED else ''
-            ignored_tag = ' [IGNORED]' if request.IGNORED else ''
-            evque.publish('sim.log', cloca.now(), f'accept {request.VM.NAME}' + required_tag + ignored_tag)
-
-    def _handle_request_reject(self, requests):
-        """
-            Handle the rejection of requests by recording the event and publishing a log.
-
-            This method iterates over each request, records it as 'rejected' if it's not ignored,
-            and publishes a rejection log with the request's virtual machine name and any
-            required or ignored flags.
-
-            Parameters
-            ----------
-            requests : list
-                A list of request objects to be processed.
-
-            See Also
-            --------
-            _tracker.record : Method used to record the number of rejected requests.
-            evque.publish : Method used to publish an event to the event queue.
+        topic : str
+            The event topic.
+        *args
+            Arguments forwarded to the topic handler.
         """
-        requests = [r for r in requests if isinstance(r, model.Request)]
-        self.tracker.record('rejected', [r for r in requests if not r.IGNORED])
-        for request in requests:
-            required_tag = ' [REQUIRED]' if request.REQUIRED else ''
-            ignored_tag = ' [IGNORED]' if request.IGNORED else ''
-            evque.publish('sim.log', cloca.now(), f'reject {request.VM.NAME}' + required_tag + ignored_tag)
+        handler = self._immediate_handlers.get(topic)
+        if handler:
+            handler(*args)
+        else:
+            evque.publish(topic, self._current_tick, *args)
 
     def _handle_action_execute(self, actions: list[model.Action, ...]) -> Simulation:
         """
@@ -386,11 +475,10 @@ class Simulation:
 
         Notes
         -----
-        Only actions with a defined EXECUTE callable will be executed.
+        Producers publish only actions with a defined EXECUTE callable.
         """
         for action in actions:
-            if action.EXECUTE:
-                action.EXECUTE()
+            action.EXECUTE()
         return self
 
     def _handle_simulation_log(self, message: str) -> None:
@@ -410,8 +498,25 @@ class Simulation:
         if self.LOG:
             print(f'{self.NAME}@{cloca.now()}> {message}')
 
-    @staticmethod
-    def _create_log_formatter(template_suffix) -> Callable:
+    def _handle_simulation_log_batch(self, messages: list[str, ...]) -> None:
+        """
+        Logs a batch of messages to the console with a single event dispatch.
+
+        Parameters
+        ----------
+        messages : list[str, ...]
+            input messages, printed in order
+
+        Returns
+        -------
+        None
+            This method does not return any value, it simply prints the messages to the console.
+        """
+        if self.LOG:
+            prefix = f'{self.NAME}@{cloca.now()}> '
+            print(prefix + f'\n{prefix}'.join(messages))
+
+    def _create_log_formatter(self, template_suffix) -> Callable:
         """
         Returns a logger function that prefixes messages with the standard format
         and appends a given message template.
@@ -427,6 +532,12 @@ class Simulation:
             A function that logs messages with a standard prefix followed by the formatted template_suffix.
         """
         template = '[{0.NAME}]: ' + template_suffix
-        return lambda *args: evque.publish('sim.log', cloca.now(), template.format(*args))
+        # Compile the template once into an f-string function; `str.format` would
+        # reparse the replacement fields on every published event.
+        fstring_body = re.sub(r'\{(\d+)', r'{args[\1]', template)
+        formatter = eval('lambda *args: f' + repr(fstring_body))
+        # Log the line directly instead of round-tripping a sim.log event through
+        # the queue; skip formatting entirely when logging is disabled.
+        return lambda *args: self._handle_simulation_log(formatter(*args)) if self.LOG else None
 
 
@@ -3,12 +3,32 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Optional
 
 import model
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _true_tuple(n: int) -> tuple[bool, ...]:
+    """
+    Return a cached all-True result tuple of the given length.
+
+    Parameters
+    ----------
+    n : int
+        length of the result tuple
+
+    Returns
+    -------
+        a tuple of n True values, shared across calls
+    """
+    return (True,) * n
+
+
+@dataclass(slots=True)
 class Os(ABC):
     """
     This class is an abstract base class for operating systems.
@@ -19,28 +39,23 @@ class Os(ABC):
         the vm in which the operating system is installed
     """
     VM: model.Vm
+    # Declared for the slots layout; all are assigned in __post_init__.
+    _running_apps: dict[int, model.App] = field(init=False, repr=False)
+    _stopped_apps: dict[int, model.App] = field(init=False, repr=False)
+    _idle_listener: Optional[Callable[[model.Vm, bool], None]] = field(init=False, repr=False)
+    _is_idle: bool = field(init=False, repr=False)
 
     def __post_init__(self):
-        # list of applications assigned to the operating system for execution
-        self._running_apps: list[model.App, ...] = []
-        # list of terminated apps
-        self._stopped_apps: list[model.App, ...] = []
-
-    def __contains__(self, app: model.App) -> bool:
-        """
-        Check if an app is present in the operating system.
-
-        Parameters
-        ----------
-        app : App
-            An instance of class `model.App` to check for existence.
-
-        Returns
-        -------
-        bool
-            True if the app is present in the operating system, False otherwise.
-        """
-        return app in self._running_apps
+        # applications assigned to the operating system for execution; an
+        # insertion-ordered dict keyed by id(app) gives O(1) membership and
+        # removal on the C-level int hash (apps hash by identity anyway)
+        self._running_apps: dict[int, model.App] = {}
+        # terminated apps since the last stopped() call
+        self._stopped_apps: dict[int, model.App] = {}
+        # optional callback informed whenever the idle state may have changed
+        self._idle_listener: Optional[Callable[[model.Vm, bool], None]] = None
+        # cached idle flag, kept in sync on every state transition
+        self._is_idle: bool = True
 
     def __iter__(self):
         """
@@ -50,7 +65,7 @@ class Os(ABC):
         -------
             An iterator over all the running apps in the operating system.
         """
-        return iter(self._running_apps)
+        return iter(self._running_apps.values())
 
     def __len__(self) -> int:
         """
@@ -78,25 +93,28 @@ class Os(ABC):
         bool
             True if the app is managed by the OS, False otherwise.
         """
-        return app in self._running_apps or app in self._stopped_apps
+        return id(app) in self._running_apps or id(app) in self._stopped_apps
 
-    def schedule(self, apps: list[model.App, ...]) -> list[bool, ...]:
+    def schedule(self, apps: list[model.App, ...]) -> tuple[bool, ...]:
         """
         The schedule function takes a list of apps and schedules them on the
-            scheduler. It returns a list of booleans indicating whether each app was
+            scheduler. It returns a tuple of booleans indicating whether each app was
             scheduled successfully or not.
 
         Parameters
         ----------
         apps : list[App, ...]
             pass in a list of apps to the schedule function
-        
+
         Returns
         -------
-            a list of booleans
+            a tuple of booleans
         """
-        self._running_apps.extend(apps)
-        return [True] * len(apps)
+        self._running_apps.update((id(app), app) for app in apps)
+        if apps:
+            self._is_idle = False
+        self._notify_idle()
+        return _true_tuple(len(apps))
 
     def terminate(self, apps: list[model.App, ...]) -> Os:
         """
@@ -108,8 +126,10 @@ class Os(ABC):
             list of instance of class `model.App` that needs to be terminated
         """
         for app in apps:
-            self._running_apps.remove(app)
-            self._stopped_apps.append(app)
+            del self._running_apps[id(app)]
+            self._stopped_apps[id(app)] = app
+        self._is_idle = not self._running_apps
+        self._notify_idle()
         return self
 
     def restart(self) -> Os:
@@ -119,8 +139,29 @@ class Os(ABC):
         """
         self._running_apps.clear()
         self._stopped_apps.clear()
+        self._is_idle = True
+        self._notify_idle()
         return self
 
+    def set_idle_listener(self, listener: Optional[Callable[[model.Vm, bool], None]]) -> Os:
+        """
+        Register a callback informed whenever the idle state of the OS may change.
+
+        Parameters
+        ----------
+        listener : Optional[Callable[[model.Vm, bool], None]]
+            callback receiving the VM and its current idle state, or None to unregister
+        """
+        self._idle_listener = listener
+        return self
+
+    def _notify_idle(self):
+        """
+        Inform the registered listener about the current idle state.
+        """
+        if self._idle_listener:
+            self._idle_listener(self.VM, self.is_idle())
+
     @abstractmethod
     def resume(self, cpu: tuple[int, ...], duration: int) -> list[int, ...]:
         """
@@ -148,8 +189,8 @@ class Os(ABC):
         -------
             list of stopped applications since last call
         """
-        finished_apps = self._stopped_apps
-        self._stopped_apps = []
+        finished_apps = list(self._stopped_apps.values())
+        self._stopped_apps.clear()
         return finished_apps
 
     def is_idle(self) -> bool:
@@ -160,10 +201,10 @@ class Os(ABC):
         -------
             A Boolean flag that is True when there is no running application
         """
-        return not bool(self._running_apps)
+        return self._is_idle
 
 
-@dataclass
+@dataclass(slots=True)
 class Vmm(ABC):
     """
     This class provides a template for implementing virtual machine managers that can allocate and deallocate VMs on
@@ -176,14 +217,20 @@ class Vmm(ABC):
     """
 
     HOST: model.Pm
+    # Declared for the slots layout; all are assigned in __post_init__.
+    _guests: dict[model.Vm, None] = field(init=False, repr=False)
+    _idle_guests: dict[model.Vm, None] = field(init=False, repr=False)
 
     def __post_init__(self):
-        # the list of allocated VMs
-        self._guests: list[model.Vm, ...] = []
+        # the allocated VMs; an insertion-ordered dict gives O(1) membership and removal
+        self._guests: dict[model.Vm, None] = {}
+        # guests whose OS currently has no running application, maintained by
+        # idle-state callbacks instead of a per-tick scan over all guests
+        self._idle_guests: dict[model.Vm, None] = {}
 
-    def __contain__(self, vm: model.Vm) -> bool:
+    def __contains__(self, vm: model.Vm) -> bool:
         """
-        Check if a Vm instance is present in the list of allocated VMs.
+        Check if a Vm instance is present in the allocated VMs.
 
         Parameters
         ----------
@@ -193,7 +240,7 @@ class Vmm(ABC):
         Returns
         -------
         bool
-            True if the VM instance is present in the allocated VMs list, False otherwise.
+            True if the VM instance is present in the allocated VMs, False otherwise.
         """
         return vm in self._guests
 
@@ -220,7 +267,7 @@ class Vmm(ABC):
         return len(self._guests)
 
     @abstractmethod
-    def has_capacity(self, vm: model.Vm) -> tuple[bool, bool, bool]:
+    def has_capacity(self, vm: model.Vm) -> bool:
         """
         Check if the host has enough CPU, RAM, and GPU resources to allocate the given virtual machine.
 
@@ -231,11 +278,8 @@ class Vmm(ABC):
 
         Returns
         -------
-        tuple[bool, bool, bool]
-            A tuple where the first element indicates if there is enough CPU,
-            the second if there is enough RAM,
-            and the third if there is enough GPU capacity.
-            Each element is `True` if there is enough capacity, otherwise `False`.
+        bool
+            True if there is enough CPU, RAM, and GPU capacity, otherwise False.
         """
         pass
 
@@ -255,6 +299,20 @@ class Vmm(ABC):
         """
         pass
 
+    def _allocate_one(self, vm: model.Vm) -> None:
+        """
+        Allocate a single VM whose capacity has already been verified by the caller.
+
+        Subclasses may override this to skip their own capacity check; the default
+        simply delegates to allocate.
+
+        Parameters
+        ----------
+        vm : Vm
+            the vm to allocate
+        """
+        self.allocate([vm])
+
     @abstractmethod
     def deallocate(self, vms: list[model.Vm, ...]) -> list[bool, ...]:
         """
@@ -284,6 +342,47 @@ class Vmm(ABC):
         """
         pass
 
+    def _track_guest(self, vm: model.Vm) -> None:
+        """
+        Start tracking the idle state of a newly allocated guest.
+
+        Parameters
+        ----------
+        vm : Vm
+            The guest virtual machine to track.
+        """
+        vm.OS.set_idle_listener(self._on_guest_idle_change)
+        if vm.OS.is_idle():
+            self._idle_guests[vm] = None
+
+    def _untrack_guest(self, vm: model.Vm) -> None:
+        """
+        Stop tracking the idle state of a deallocated guest.
+
+        Parameters
+        ----------
+        vm : Vm
+            The guest virtual machine to stop tracking.
+        """
+        vm.OS.set_idle_listener(None)
+        self._idle_guests.pop(vm, None)
+
+    def _on_guest_idle_change(self, vm: model.Vm, is_idle: bool) -> None:
+        """
+        Update the idle-guest bookkeeping when a guest changes state.
+
+        Parameters
+        ----------
+        vm : Vm
+            The guest virtual machine whose state changed.
+        is_idle : bool
+            The current idle state of the guest.
+        """
+        if is_idle and vm in self._guests:
+            self._idle_guests[vm] = None
+        else:
+            self._idle_guests.pop(vm, None)
+
     def idles(self) -> list[model.Vm, ...]:
         """
         The idles function returns list of guests that have no running load.
@@ -292,10 +391,10 @@ class Vmm(ABC):
         -------
             list of guest virtual machines with no running application
         """
-        return [guest for guest in self._guests if guest.OS.is_idle()]
+        return list(self._idle_guests)
 
 
-@dataclass
+@dataclass(slots=True)
 class Vmp(ABC):
     """
     The Placement class is an abstract base class for VM placement policies in the data center.
@@ -306,10 +405,17 @@ class Vmp(ABC):
         A data center instance whose resources are used for placement.
     """
     DATACENTER: model.DataCenter
+    # Declared for the slots layout; assigned in __post_init__.
+    _vm_pm: dict[int, model.Pm] = field(init=False, repr=False)
+    _vmm_resume: list[Callable] = field(init=False, repr=False)
 
     def __post_init__(self):
         # An internal mapping from VM instances to their respective nodes (PM).
-        self._vm_pm: dict[model.Vm, model.Pm] = {}
+        # Model objects hash and compare by identity, so keys are id(vm) ints,
+        # which sidesteps the Python-level __hash__/__eq__ dispatch on lookups.
+        self._vm_pm: dict[int, model.Pm] = {}
+        # Bound VMM.resume methods, rebuilt whenever the host list changes size.
+        self._vmm_resume: list[Callable] = []
 
     def __getitem__(self, vm: model.Vm) -> model.Pm:
         """
@@ -330,7 +436,7 @@ class Vmp(ABC):
         KeyError
             If the VM instance is not found in the placement.
         """
-        return self._vm_pm[vm]
+        return self._vm_pm[id(vm)]
 
     def empty(self) -> bool:
         """
@@ -376,8 +482,11 @@ class Vmp(ABC):
         Placement
             The placement instance itself.
         """
-        for host in self.DATACENTER.HOSTS:
-            host.VMM.resume(duration)
+        hosts = self.DATACENTER.HOSTS
+        if len(self._vmm_resume) != len(hosts):
+            self._vmm_resume = [host.VMM.resume for host in hosts]
+        for resume in self._vmm_resume:
+            resume(duration)
         return self
 
     @abstractmethod
@@ -426,7 +535,7 @@ class Vmp(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlPlane(ABC):
     """
     The ControlPlane class is an abstract base class that represents the policy included in a cluster controller.
@@ -438,12 +547,16 @@ class ControlPlane(ABC):
     """
 
     CLUSTER_CONTROLLER: model.Controller
+    # Declared for the slots layout; both are assigned in __post_init__.
+    _pending_deployments: deque[model.Deployment] = field(init=False, repr=False)
+    _scaled_deployments: dict[model.Deployment, int] = field(init=False, repr=False)
 
     def __post_init__(self):
-        # Deployments submitted for execution
-        self._pending_deployments: list[model.Deployment] = []
-        # Deployments with a scaling request
-        self._scaled_deployments: list[model.Deployment] = []
+        # Deployments submitted for execution; deque gives O(1) front drain
+        self._pending_deployments: deque[model.Deployment] = deque()
+        # Deployments with a scaling request, mapped to the latest requested
+        # replica count so repeated scales of one deployment coalesce
+        self._scaled_deployments: dict[model.Deployment, int] = {}
 
     def apply(self, deployment: model.Deployment) -> ControlPlane:
         """
@@ -479,7 +592,7 @@ class ControlPlane(ABC):
             the control plane itself
         """
         deployment.replicas = replicas
-        self._scaled_deployments.append(deployment)
+        self._scaled_deployments[deployment] = replicas
         return self
 
     @abstractmethod
@@ -1,8 +1,11 @@
-from dataclasses import dataclass, asdict
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+from typing import Callable, Optional
 
-import cloca
-import evque
+# Bound once at import; saves a module-dict lookup at every call site.
+from cloca import now as _now
+from evque import publish as _publish, subscribe as _subscribe
 
 import model
 import policy
@@ -32,16 +35,43 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
             self._node_ram[node] = node.RAM
             self._node_gpu[node] = node.GPU
 
-        # Initializing container and deployment related dictionaries.
-        self._deployment_replicas: dict[model.Deployment, list[list[model.Container, ...], ...]] = {}
+        # Initializing container and deployment related dictionaries. Replicas
+        # are id-keyed sets so membership, removal and LIFO teardown are O(1).
+        self._deployment_replicas: dict[model.Deployment, dict[int, set[model.Container]]] = {}
+        self._replica_id_counter = count()
         self._container_deployment: dict[model.Container, model.Deployment] = {}
         self._container_node: dict[model.Container, model.Vm] = {}
+        # Side-index from a container to the id and set of the replica holding
+        # it, so removals need not scan every replica of the deployment.
+        self._container_replica: dict[model.Container, tuple[int, set[model.Container]]] = {}
 
-        # List of deployments that haven't reached their desired replica count.
-        # Each entry is a tuple containing the deployment and the number of replicas yet to be deployed.
-        self._degraded_deployments: list[tuple[model.Deployment, int], ...] = []
+        # Memoized per-deployment resource totals; container specs are immutable,
+        # so entries never go stale.
+        self._deployment_resources: dict[model.Deployment, tuple] = {}
 
-        evque.subscribe('container.stop', self._delete_container)
+        # Deployment status events buffered during a manage() pass and
+        # published in one flush at its end.
+        self._pending_events: list[tuple] = []
+
+        # Deployments that haven't reached their desired replica count; a deque
+        # gives O(1) front drain. Each entry is a tuple containing the
+        # deployment and the number of replicas yet to be deployed.
+        self._degraded_deployments: deque[tuple[model.Deployment, int]] = deque()
+
+        # Rotating start offset so placement does not always begin at the
+        # first node, which would bias load toward early nodes.
+        self._rr_cursor: int = 0
+
+        # Cached bound schedule methods; nodes never change their OS.
+        self._node_schedule: dict[model.Vm, Callable] = {node: node.OS.schedule
+                                                         for node in self.CLUSTER_CONTROLLER.NODES}
+
+        # GPU accounting differs per control plane; bind the strategy once
+        # instead of dispatching through an override on every (de)allocation.
+        self._deduct_gpu = self._deduct_gpu_discrete
+        self._release_gpu = self._release_gpu_discrete
+
+        _subscribe('container.stop', self._delete_container)
 
     def _deploy_deployment(self, deployment: model.Deployment, num_replicas: int = None) -> int:
         """
@@ -64,15 +94,33 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         prev_num_deployed_replicas = num_deployed_replicas
 
         if not self._deployment_replicas.get(deployment):
-            self._deployment_replicas[deployment] = []
+            self._deployment_replicas[deployment] = {}
+
+        # Deploying replicas does not toggle node power state, so the live
+        # workers are computed once rather than re-filtered per pass.
+        live_workers = [node for node in self.CLUSTER_CONTROLLER.NODES if node.is_on()]
+        if live_workers:
+            # Start from the rotating cursor for an even spread across nodes.
+            start = self._rr_cursor % len(live_workers)
+            live_workers = live_workers[start:] + live_workers[:start]
+
+        # The totals are constant per deployment; hoist them out of the loop.
+        requested_cpu, requested_ram, requested_gpu = self._get_deployment_requested_resources(deployment)
 
         # Loop to continuously deploy replicas until no more can be deployed.
         while True:
-            for worker in filter(lambda n: n.is_on(), self.CLUSTER_CONTROLLER.NODES):
+            # Node resources only shrink during this call, so a worker that
+            # failed to fit a replica is dropped from the following passes.
+            fitting_workers = []
+            for worker in live_workers:
                 if num_replicas == num_deployed_replicas:
                     return num_deployed_replicas
-                elif self._deploy_replica(deployment, worker):
+                elif self._has_sufficient_resources(requested_cpu, requested_ram, requested_gpu, worker):
+                    self._deploy_replica_unchecked(deployment, worker)
                     num_deployed_replicas += 1
+                    self._rr_cursor += 1
+                    fitting_workers.append(worker)
+            live_workers = fitting_workers
 
             # Terminate the loop if no new replicas were executed in this iteration.
             if prev_num_deployed_replicas == num_deployed_replicas:
@@ -99,15 +147,35 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         """
         if not self._has_sufficient_resources_for_deployment(deployment, node):
             return False
+        self._deploy_replica_unchecked(deployment, node)
+        return True
+
+    def _deploy_replica_unchecked(self, deployment: model.Deployment, node: model.Vm) -> None:
+        """
+        Deploy a replica whose resource fit has already been established.
 
+        Parameters
+        ----------
+        deployment : model.Deployment
+            Deployment to be deployed.
+        node : model.Vm
+            Node (VM) on which to deploy the replica.
+        """
         replica_containers = [Container(**container_spec) for container_spec in deployment.CONTAINER_SPECS]
+        replica_id = next(self._replica_id_counter)
+        replica_set = set(replica_containers)
         for container in replica_containers:
-            self._deploy_container(container, node)
+            # The caller's aggregate check covers the whole replica, so the
+            # per-container revalidation is skipped.
+            self._deploy_container_unchecked(container, node)
             self._container_node[container] = node
             self._container_deployment[container] = deployment
+            self._container_replica[container] = (replica_id, replica_set)
 
-        self._deployment_replicas[deployment].append(replica_containers)
-        return True
+        # Schedule the whole replica on the node in one batched call.
+        self._node_schedule[node](replica_containers)
+
+        self._deployment_replicas[deployment][replica_id] = replica_set
 
     def delete(self, deployment: model.Deployment, num_replicas: int = None) -> policy.ControlPlane:
         """
@@ -125,17 +193,19 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         policy.ControlPlane
             Current instance of the control plane.
         """
+        replicas = self._deployment_replicas[deployment]
         if not num_replicas:
-            num_replicas = len(self._deployment_replicas[deployment])
+            num_replicas = len(replicas)
 
-        while self._deployment_replicas[deployment] and num_replicas:
-            replica_containers = self._deployment_replicas[deployment].pop()
+        while replicas and num_replicas:
+            # popitem() removes the most recently deployed replica first.
+            _, replica_containers = replicas.popitem()
             while replica_containers:
                 container = replica_containers.pop()
                 self._delete_container(None, container)
             num_replicas -= 1
 
-        if not self._deployment_replicas[deployment]:
+        if not replicas:
             del self._deployment_replicas[deployment]
 
         return self
@@ -156,21 +226,44 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         bool
             True if the container was successfully deployed, False otherwise.
         """
-        if not self._has_sufficient_resources_for_container(asdict(container), node):
+        if not self._has_sufficient_resources_for_container(container, node):
             return False
+        self._deploy_container_unchecked(container, node)
+        self._node_schedule[node]([container])
+        return True
+
+    def _deploy_container_unchecked(self, container: model.Container, node: model.Vm) -> None:
+        """
+        Deduct the resources of a container whose fit has already been
+        established; scheduling the container is the caller's responsibility.
 
+        Parameters
+        ----------
+        container : model.Container
+            The container to be deployed.
+        node : model.Vm
+            The node (VM) on which to deploy the container.
+        """
         # Retrieve the resources required by the container.
-        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(asdict(container))
+        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container)
 
         # Update the node's resources.
         self._node_cpu[node] -= requested_cpu
         self._node_ram[node] -= requested_ram
-        self._node_gpu[node] = ()  # Assuming GPU resources are fully utilized and set to empty tuple
+        self._deduct_gpu(node, requested_gpu)
 
-        # Schedule the container on the node.
-        node.OS.schedule([container])
+    def _deduct_gpu_discrete(self, node: model.Vm, requested_gpu: Optional[tuple[int, int]]) -> None:
+        """
+        Mark the node's GPU as consumed by a deployed container.
+        """
+        # Assuming GPU resources are fully utilized and set to empty tuple
+        self._node_gpu[node] = ()
 
-        return True
+    def _release_gpu_discrete(self, node: model.Vm, requested_gpu: Optional[tuple[int, int]]) -> None:
+        """
+        Restore the node's GPU released by a deleted container.
+        """
+        self._node_gpu[node] = requested_gpu
 
     def _delete_container(self, node: Optional[model.Vm], container: model.Container) -> bool:
         """
@@ -194,12 +287,12 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
             raise ValueError("Container not found on the specified node.")
 
         # Retrieve the resources utilized by the container.
-        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(asdict(container))
+        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container)
 
         # Release the resources.
         self._node_cpu[node] += requested_cpu
         self._node_ram[node] += requested_ram
-        self._node_gpu[node] = requested_gpu
+        self._release_gpu(node, requested_gpu)
 
         self._remove_container_references(container)
 
@@ -218,27 +311,27 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         container : model.Container
             the container to be removed from references
         """
-        deployment = self._container_deployment[container]
-        del self._container_deployment[container]
+        deployment = self._container_deployment.pop(container)
 
         # Remove the container from node-container mapping.
         del self._container_node[container]
 
-        # Remove the container from deployment replicas and clean up if needed.
-        replicas = self._deployment_replicas.get(deployment, [])
-        for i, replica in enumerate(replicas):
-            if container in replica:
-                replica.remove(container)
+        # Detach the container from its replica via the side-index; delete()
+        # may have already popped both the container and its replica set.
+        replica_id, replica = self._container_replica.pop(container)
+        if container in replica:
+            replica.remove(container)
 
-                # If the replica list is empty after removal, delete it.
-                if not replica:
-                    del self._deployment_replicas[deployment][i]
+            # If the replica set is empty after removal, delete it.
+            if not replica:
+                replicas = self._deployment_replicas.get(deployment)
+                if replicas is not None:
+                    del replicas[replica_id]
 
                     # If there are no replicas left for the deployment, delete the deployment entry.
-                    if not self._deployment_replicas[deployment]:
+                    if not replicas:
                         del self._deployment_replicas[deployment]
-                        evque.publish('deployment.stop', cloca.now(), self.CLUSTER_CONTROLLER, deployment)
-                break
+                        _publish('deployment.stop', _now(), self.CLUSTER_CONTROLLER, deployment)
 
     def _has_sufficient_resources_for_deployment(self, deployment: model.Deployment, node: model.Vm) -> bool:
         """
@@ -259,14 +352,14 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         requested_cpu, requested_ram, requested_gpu = self._get_deployment_requested_resources(deployment)
         return self._has_sufficient_resources(requested_cpu, requested_ram, requested_gpu, node)
 
-    def _has_sufficient_resources_for_container(self, container_spec: dict, node: model.Vm) -> bool:
+    def _has_sufficient_resources_for_container(self, container: model.Container, node: model.Vm) -> bool:
         """
         Check if a node has sufficient resources to deploy a given container.
 
         Parameters
         ----------
-        container_spec : dict
-            The container spec to check resources for.
+        container : model.Container
+            The container to check resources for.
         node : model.Vm
             The node to check resources against.
 
@@ -275,11 +368,11 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         bool
             True if there are sufficient resources, False otherwise.
         """
-        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container_spec)
-        return self._has_sufficient_resources(requested_cpu, requested_ram, [requested_gpu], node)
+        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container)
+        return self._has_sufficient_resources(requested_cpu, requested_ram, frozenset((requested_gpu,)), node)
 
     def _has_sufficient_resources(self, requested_cpu: float, requested_ram: int,
-                                  requested_gpu: list[tuple[int, int], ...], node: model.Vm) -> bool:
+                                  requested_gpu: frozenset[tuple[int, int]], node: model.Vm) -> bool:
         """
         General method to check if a node has sufficient resources.
 
@@ -289,7 +382,7 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
             The required CPU.
         requested_ram : int
             The required RAM.
-        requested_gpu : list[tuple[int, int], ...]
+        requested_gpu : frozenset[tuple[int, int]]
             The required GPUs.
         node : model.Vm
             The node to check resources against.
@@ -299,12 +392,13 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         bool
             True if there are sufficient resources, False otherwise.
         """
-        has_cpu: bool = self._node_cpu[node] >= requested_cpu
-        has_ram: bool = self._node_ram[node] >= requested_ram
-        has_gpu: bool = not requested_gpu or self._node_gpu[node] in requested_gpu
-        return has_cpu and has_ram and has_gpu
+        # Short-circuit cheapest checks first; the GPU membership test only
+        # runs when the O(1) CPU and RAM comparisons pass.
+        return (self._node_cpu[node] >= requested_cpu
+                and self._node_ram[node] >= requested_ram
+                and (not requested_gpu or self._node_gpu[node] in requested_gpu))
 
-    def _get_deployment_requested_resources(self, deployment: model.Deployment) -> tuple[float, int, list[tuple[int, int], ...]]:
+    def _get_deployment_requested_resources(self, deployment: model.Deployment) -> tuple[float, int, frozenset[tuple[int, int]]]:
         """
         Retrieve the total requested resources by a deployment.
 
@@ -318,22 +412,42 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         tuple
             A tuple containing total requested CPU, RAM, and GPU resources.
         """
-        total_requested_cpu, total_requested_ram, total_requested_gpu = 0, 0, []
-        for container_spec in deployment.CONTAINER_SPECS:
-            requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container_spec)
-            total_requested_cpu += requested_cpu
-            total_requested_ram += requested_ram
-            total_requested_gpu.append(requested_gpu)
-        return total_requested_cpu, total_requested_ram, total_requested_gpu
+        if deployment in self._deployment_resources:
+            return self._deployment_resources[deployment]
+
+        specs = deployment.CONTAINER_SPECS
+        # A frozenset makes the per-node GPU membership test O(1).
+        totals = (sum(spec['CPU'][0] for spec in specs),
+                  sum(spec['RAM'][0] for spec in specs),
+                  frozenset(spec['GPU'] for spec in specs))
+        self._deployment_resources[deployment] = totals
+        return totals
+
+    @staticmethod
+    def _get_container_requested_resources(container: model.Container) -> tuple[float, int, tuple[int, int]]:
+        """
+        Extract the requested resources of a container by attribute access.
+
+        Parameters
+        ----------
+        container : model.Container
+            The container whose requested resources are to be extracted.
+
+        Returns
+        -------
+        tuple[float, int, tuple[int, int]]
+            A tuple containing requested CPU, RAM, and GPU requirements by the container.
+        """
+        return container.CPU[0], container.RAM[0], container.GPU
 
     @staticmethod
-    def _get_container_requested_resources(container_spec: dict) -> tuple[float, int, tuple[int, int]]:
+    def _get_spec_requested_resources(container_spec: dict) -> tuple[float, int, tuple[int, int]]:
         """
         Extract the requested resources of a container from its spec.
 
         Parameters
         ----------
-        container_spec : model.Container
+        container_spec : dict
             The spec of the container whose requested resources are to be extracted.
 
         Returns
@@ -359,15 +473,15 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
 
         # Loop through all degraded deployments
         while num_degraded_deployments:
-            deployment, num_remained_replicas = self._degraded_deployments.pop(0)
+            deployment, num_remained_replicas = self._degraded_deployments.popleft()
             num_remained_replicas -= self._deploy_deployment(deployment, num_remained_replicas)
 
             # If all required replicas were not executed, re-append to degraded deployments
             if num_remained_replicas:
                 self._degraded_deployments.append((deployment, num_remained_replicas))
-                evque.publish('deployment.degrade', cloca.now(), self.CLUSTER_CONTROLLER, deployment, num_remained_replicas)
+                self._pending_events.append(('deployment.degrade', _now(), self.CLUSTER_CONTROLLER, deployment, num_remained_replicas))
             else:
-                evque.publish('deployment.run', cloca.now(), self.CLUSTER_CONTROLLER, deployment)
+                self._pending_events.append(('deployment.run', _now(), self.CLUSTER_CONTROLLER, deployment))
 
             num_degraded_deployments -= 1
 
@@ -386,19 +500,19 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
 
         # Loop through all pending deployments
         while num_pending_deployments:
-            deployment = self._pending_deployments.pop(0)
+            deployment = self._pending_deployments.popleft()
             num_deployed_replicas = self._deploy_deployment(deployment)
 
             # Determine the status of deployment execution
             if not num_deployed_replicas:
                 self._pending_deployments.append(deployment)
-                evque.publish('deployment.pend', cloca.now(), self.CLUSTER_CONTROLLER, deployment)
+                self._pending_events.append(('deployment.pend', _now(), self.CLUSTER_CONTROLLER, deployment))
             elif num_deployed_replicas < deployment.replicas:
                 num_remained_replicas = deployment.replicas - num_deployed_replicas
                 self._degraded_deployments.append((deployment, num_remained_replicas))
-                evque.publish('deployment.degrade', cloca.now(), self.CLUSTER_CONTROLLER, deployment, num_remained_replicas)
+                self._pending_events.append(('deployment.degrade', _now(), self.CLUSTER_CONTROLLER, deployment, num_remained_replicas))
             else:
-                evque.publish('deployment.run', cloca.now(), self.CLUSTER_CONTROLLER, deployment)
+                self._pending_events.append(('deployment.run', _now(), self.CLUSTER_CONTROLLER, deployment))
 
             num_pending_deployments -= 1
 
@@ -413,27 +527,26 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         -------
         - This method should be called prior to `_deploy_degraded_deployments()` to ensure consistency.
         """
-        num_scaled_deployments = len(self._scaled_deployments)
-
-        # Loop through all scaled deployments
-        while num_scaled_deployments:
-            deployment = self._scaled_deployments.pop(0)
+        if not self._scaled_deployments:
+            return
+        # Swap out the coalesced requests in one move and drain the snapshot.
+        scaled_deployments = self._scaled_deployments
+        self._scaled_deployments = {}
 
+        for deployment, replicas in scaled_deployments.items():
             current_replicas = len(self._deployment_replicas[deployment])
-            required_replicas = deployment.replicas - current_replicas
+            required_replicas = replicas - current_replicas
 
             # Scale up or down based on the difference
             if required_replicas < 0:
                 to_delete_replicas = abs(required_replicas)
                 self.delete(deployment, to_delete_replicas)
-                evque.publish('deployment.scale', cloca.now(), self.CLUSTER_CONTROLLER, deployment, required_replicas)
+                self._pending_events.append(('deployment.scale', _now(), self.CLUSTER_CONTROLLER, deployment, required_replicas))
             elif required_replicas > 0:
                 self._degraded_deployments.append((deployment, required_replicas))
-                evque.publish('deployment.scale', cloca.now(), self.CLUSTER_CONTROLLER, deployment, required_replicas)
+                self._pending_events.append(('deployment.scale', _now(), self.CLUSTER_CONTROLLER, deployment, required_replicas))
             else:
-                evque.publish('deployment.run', cloca.now(), self.CLUSTER_CONTROLLER, deployment)
-
-            num_scaled_deployments -= 1
+                self._pending_events.append(('deployment.run', _now(), self.CLUSTER_CONTROLLER, deployment))
 
     def manage(self):
         """
@@ -443,6 +556,12 @@ class ControlPlaneRoundRobin(policy.ControlPlane):
         self._deploy_degraded_deployments()
         self._deploy_pending_deployments()
 
+        # Publish the status events buffered by the phases in one flush.
+        if self._pending_events:
+            for event in self._pending_events:
+                _publish(*event)
+            self._pending_events.clear()
+
     def is_stopped(self) -> bool:
         """
         Check if the control plane service is stopped.
@@ -469,91 +588,22 @@ class FractionalGPUControlPlaneRoundRobin(ControlPlaneRoundRobin):
         for node in self.CLUSTER_CONTROLLER.NODES:
             # Set GPU availability to 1.0 (100%) if the node has a GPU, otherwise set it to 0.0.
             self._node_gpu[node] = 1.0 if node.GPU else 0.0
+        # Fractions of a GPU are deducted and released arithmetically.
+        self._deduct_gpu = self._deduct_gpu_fractional
+        self._release_gpu = self._release_gpu_fractional
 
-    def _deploy_container(self, container: model.Container, node: model.Vm) -> bool:
+    def _deduct_gpu_fractional(self, node: model.Vm, requested_gpu: float) -> None:
         """
-        Deploy a container to a node if the node has sufficient resources.
-
-        Parameters
-        ----------
-        container : model.Container
-            The container to be deployed.
-        node : model.Vm
-            The node where the container should be deployed.
-
-        Returns
-        -------
-        bool
-            True if the container was successfully deployed, False otherwise.
+        Deduct the container's GPU fraction from the node.
         """
-        # Check if the node has sufficient resources for the container.
-        if not self._has_sufficient_resources_for_container(asdict(container), node):
-            return False
-
-        # Extract the resources required by the container.
-        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(asdict(container))
-
-        # Deduct the resources used by the container from the node's available resources.
-        self._node_cpu[node] -= requested_cpu
-        self._node_ram[node] -= requested_ram
         self._node_gpu[node] -= requested_gpu
 
-        # Schedule the container on the node.
-        node.OS.schedule([container])
-
-        return True
-
-    def _delete_container(self, node: Optional[model.Vm], container: model.Container) -> bool:
+    def _release_gpu_fractional(self, node: model.Vm, requested_gpu: float) -> None:
         """
-        Delete a container.
-
-        Parameters
-        ----------
-        container : model.Container
-            The container to be deleted.
-        node : model.Vm
-            The node on of the container
-
-        Returns
-        -------
-        bool
-            True if the container was successfully deleted, False otherwise.
+        Release the container's GPU fraction back to the node.
         """
-        if not node:
-            node = self._container_node[container]
-        elif self._container_node[container] != node:
-            raise ValueError("Container not found on the specified node.")
-
-        # Extract the resources utilized by the container.
-        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(asdict(container))
-
-        # Release the resources back to the node.
-        self._node_cpu[node] += requested_cpu
-        self._node_ram[node] += requested_ram
         self._node_gpu[node] += requested_gpu
 
-        # Remove references to the container from internal data structures.
-        self._remove_container_references(container)
-
-        return True
-
-    @staticmethod
-    def _get_container_requested_resources(container_spec: dict) -> tuple[float, int, float]:
-        """
-        Extract the requested resources of a container from its spec.
-
-        Parameters
-        ----------
-        container_spec : model.Container
-            The spec of the container whose requested resources are to be extracted.
-
-        Returns
-        -------
-        tuple[float, int, float]
-            A tuple containing requested CPU, RAM, and GPU requirements by the container.
-        """
-        return container_spec['CPU'][0], container_spec['RAM'][0], container_spec['GPU']
-
     def _has_sufficient_resources(self, requested_cpu: float, requested_ram: int, requested_gpu: float, node: model.Vm) -> bool:
         """
         General method to check if a node has sufficient resources.
@@ -574,10 +624,9 @@ class FractionalGPUControlPlaneRoundRobin(ControlPlaneRoundRobin):
         bool
             True if there are sufficient resources, False otherwise.
         """
-        has_cpu: bool = self._node_cpu[node] >= requested_cpu
-        has_ram: bool = self._node_ram[node] >= requested_ram
-        has_gpu: bool = self._node_gpu[node] >= requested_gpu
-        return has_cpu and has_ram and has_gpu
+        return (self._node_cpu[node] >= requested_cpu
+                and self._node_ram[node] >= requested_ram
+                and self._node_gpu[node] >= requested_gpu)
 
     def _get_deployment_requested_resources(self, deployment: model.Deployment) -> tuple[float, int, float]:
         """
@@ -593,27 +642,31 @@ class FractionalGPUControlPlaneRoundRobin(ControlPlaneRoundRobin):
         tuple
             A tuple containing total requested CPU, RAM, and GPU resources.
         """
-        total_requested_cpu, total_requested_ram, total_requested_gpu = 0.0, 0, 0.0
-        for container_spec in deployment.CONTAINER_SPECS:
-            requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container_spec)
-            total_requested_cpu += requested_cpu
-            total_requested_ram += requested_ram
-            total_requested_gpu += requested_gpu  # Summing up the GPU requirements for each container
+        if deployment in self._deployment_resources:
+            return self._deployment_resources[deployment]
+
+        specs = deployment.CONTAINER_SPECS
+        total_requested_cpu = sum(spec['CPU'][0] for spec in specs)
+        total_requested_ram = sum(spec['RAM'][0] for spec in specs)
+        # Summing up the GPU requirements for each container
+        total_requested_gpu = sum(spec['GPU'] for spec in specs)
 
         # Ensure that the total GPU requirement does not exceed 1.0 (100%)
         if total_requested_gpu > 1.0:
-            AssertionError('GPU requirement must not exceed 1.0')
+            raise AssertionError('GPU requirement must not exceed 1.0')
 
-        return total_requested_cpu, total_requested_ram, total_requested_gpu
+        totals = total_requested_cpu, total_requested_ram, total_requested_gpu
+        self._deployment_resources[deployment] = totals
+        return totals
 
-    def _has_sufficient_resources_for_container(self, container_spec: dict, node: model.Vm) -> bool:
+    def _has_sufficient_resources_for_container(self, container: model.Container, node: model.Vm) -> bool:
         """
         Check if a node has sufficient resources to deploy a given container.
 
         Parameters
         ----------
-        container_spec : dict
-            The container spec to check resources for.
+        container : model.Container
+            The container to check resources for.
         node : model.Vm
             The node to check resources against.
 
@@ -622,5 +675,5 @@ class FractionalGPUControlPlaneRoundRobin(ControlPlaneRoundRobin):
         bool
             True if there are sufficient resources, False otherwise.
         """
-        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container_spec)
+        requested_cpu, requested_ram, requested_gpu = self._get_container_requested_resources(container)
         return self._has_sufficient_resources(requested_cpu, requested_ram, requested_gpu, node)
\ No newline at end of file
@@ -1,11 +1,32 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
-import cloca
-import evque
+# Bound once at import; saves a module-dict lookup at every call site.
+from cloca import now as _now
+from evque import publish as _publish
 
 import policy
 
 
+@lru_cache(maxsize=None)
+def _app_topics(cls: type) -> tuple[str, str]:
+    """
+    Return the cached start and stop event topics for an app class.
+
+    Parameters
+    ----------
+    cls : type
+        the app class whose lifecycle topics are requested
+
+    Returns
+    -------
+    tuple[str, str]
+        the start and stop topic names derived from the class name
+    """
+    name = cls.__name__.lower()
+    return f'{name}.start', f'{name}.stop'
+
+
 @dataclass
 class OsTimeShared(policy.Os):
     """
@@ -35,17 +56,24 @@ class OsTimeShared(policy.Os):
 
         # Compute the initial cycles available for all cores
         remained_cycles = [core * duration for core in cpu]
+        num_cores = len(remained_cycles)
+        # Per-app share buffer, reused across apps to avoid a list allocation each.
+        available_cycles = [0] * num_cores
 
         num_apps = len(self)
         for app in self:
             if not app.has_resumed_once():
-                evque.publish(f'{type(app).__name__.lower()}.start', cloca.now(), self.VM, app)
+                start_topic, _ = _app_topics(type(app))
+                _publish(start_topic, _now(), self.VM, app)
 
-            available_cycles = [core * duration // num_apps for core in remained_cycles]
+            # Each app gets an equal share of the cycles still remaining; the
+            # remaining cycles already account for the duration.
+            for i in range(num_cores):
+                available_cycles[i] = remained_cycles[i] // num_apps
             consumed_cycles = app.resume(available_cycles)
 
             # Calculate the remaining cycles after the app has consumed some
-            for i in range(len(remained_cycles)):
+            for i in range(num_cores):
                 remained_cycles[i] -= consumed_cycles[i]
 
             if app.is_stopped():
@@ -58,7 +86,8 @@ class OsTimeShared(policy.Os):
         # Terminate finished apps
         for stopped_app in stopped_apps:
             self.terminate([stopped_app])
-            evque.publish(f'{type(app).__name__.lower()}.stop', cloca.now(), self.VM, stopped_app)
+            _, stop_topic = _app_topics(type(stopped_app))
+            _publish(stop_topic, _now(), self.VM, stopped_app)
 
         # Return the cycles consumed on each core
         return [core * duration - rc for core, rc in zip(cpu, remained_cycles)]
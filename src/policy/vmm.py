@@ -1,9 +1,61 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
 
 import model
 import policy
 
 
+@lru_cache(maxsize=None)
+def _placement_masks(num_memory_blocks: int, num_gpu_blocks: int) -> tuple[int, ...]:
+    """
+    Return the cached candidate placement bitmasks for a profile size on a GPU size.
+
+    Parameters
+    ----------
+    num_memory_blocks : int
+        the number of contiguous memory blocks the profile requires
+    num_gpu_blocks : int
+        the total number of memory blocks on the GPU
+
+    Returns
+    -------
+    tuple[int, ...]
+        one bitmask per possible start position, each covering a contiguous run
+        of `num_memory_blocks` blocks
+    """
+    window = (1 << num_memory_blocks) - 1
+    return tuple(window << start for start in range(num_gpu_blocks - num_memory_blocks + 1))
+
+
+@lru_cache(maxsize=None)
+def _first_placement(num_memory_blocks: int, num_gpu_blocks: int, free_gpu: int) -> int:
+    """
+    Return the first placement mask that fits in the given free-block mask, or 0.
+
+    The arguments enumerate a small space (profile size, GPU size, free mask), so the
+    cache acts as a lazily built lookup table shared by every host.
+
+    Parameters
+    ----------
+    num_memory_blocks : int
+        the number of contiguous memory blocks the profile requires
+    num_gpu_blocks : int
+        the total number of memory blocks on the GPU
+    free_gpu : int
+        a bitmask of the free memory blocks on the GPU
+
+    Returns
+    -------
+    int
+        the first fitting placement bitmask, or 0 if the profile does not fit
+    """
+    for mask in _placement_masks(num_memory_blocks, num_gpu_blocks):
+        if free_gpu & mask == mask:
+            return mask
+    return 0
+
+
 @dataclass
 class VmmSpaceShared(policy.Vmm):
     """
@@ -15,19 +67,34 @@ class VmmSpaceShared(policy.Vmm):
         The __post_init__ function is called after the object has been initialized.
         This function is used to set up any additional attributes that are not part of
         the initialization process. In this case, we want to keep track of available CPU,
-        RAM, and GPU of the host.
+        RAM, and GPU of the host. Free cores and free GPU memory blocks are kept as int
+        bitmasks (bit i set means unit i is free), so capacity checks and (de)allocation
+        are single integer operations instead of set manipulations.
         """
         super().__post_init__()
-        self._free_cpu: set[model.Vm, ...] = {core for core in range(len(self.HOST.CPU))}
-        self._vm_cpu: dict[model.Vm, set[int, ...]] = {}
+        self._free_cpu: int = (1 << len(self.HOST.CPU)) - 1
+        self._vm_cpu: dict[int, int] = {}
+        # Capacities of each VM's assigned cores; the assignment only changes on
+        # (de)allocation, so the list is materialized once instead of every tick.
+        self._vm_cpu_capacities: dict[int, list[int]] = {}
         self._free_ram: int = self.HOST.RAM
-        self._free_gpu: tuple[set[int], ...] = tuple({block for block in range(blocks)} for _, blocks in self.HOST.GPU)
-        self._vm_gpu: dict[model.Vm, tuple[int, set[int, ...]]] = {}
+        self._free_gpu: list[int] = [(1 << blocks) - 1 for _, blocks in self.HOST.GPU]
+        self._gpu_num_blocks: tuple[int, ...] = tuple(blocks for _, blocks in self.HOST.GPU)
+        self._vm_gpu: dict[int, tuple[int, int]] = {}
+        # Bound OS.resume methods, cached on allocation; saves two attribute
+        # lookups per running VM on every tick.
+        self._vm_resume: dict[int, Callable] = {}
+        # The placement found by the last successful has_capacity, handed to the
+        # allocation that typically follows so the search is not repeated.
+        self._last_placement: tuple[int, int, int] | None = None
 
-    def has_capacity(self, vm: model.Vm) -> tuple[bool, bool, bool]:
+    def has_capacity(self, vm: model.Vm) -> bool:
         """
         Check if the host has enough CPU, RAM, and GPU resources to allocate the given virtual machine.
 
+        The checks run cheapest first, so a host that is out of CPU or RAM never
+        pays for the GPU placement search.
+
         Parameters
         ----------
         vm : Vm
@@ -35,17 +102,27 @@ class VmmSpaceShared(policy.Vmm):
 
         Returns
         -------
-        tuple[bool, bool, bool]
-            A tuple where the first element indicates if there is enough CPU,
-            the second if there is enough RAM,
-            and the third if there is enough GPU capacity.
-            Each element is `True` if there is enough capacity, otherwise `False`.
+        bool
+            True if there is enough CPU, RAM, and GPU capacity, otherwise False.
         """
-        has_cpu_capacity = len(self._free_cpu) >= vm.CPU
-        has_ram_capacity = self._free_ram >= vm.RAM
-        has_gpu_capacity = not vm.GPU or any(self.find_gpu_blocks(vm.GPU, gpu) for gpu in self._free_gpu)
-
-        return has_cpu_capacity, has_ram_capacity, has_gpu_capacity
+        if self._free_cpu.bit_count() < vm.CPU:
+            return False
+        if self._free_ram < vm.RAM:
+            return False
+        if vm.GPU:
+            num_memory_blocks = vm.GPU[1]
+            for gpu_idx in range(len(self._free_gpu)):
+                free_gpu = self._free_gpu[gpu_idx]
+                # A GPU with fewer free blocks than requested cannot fit the
+                # profile no matter how the blocks are laid out.
+                if free_gpu.bit_count() < num_memory_blocks:
+                    continue
+                gpu_blocks = _first_placement(num_memory_blocks, self._gpu_num_blocks[gpu_idx], free_gpu)
+                if gpu_blocks:
+                    self._last_placement = id(vm), gpu_idx, gpu_blocks
+                    return True
+            return False
+        return True
 
     def allocate(self, vms: list[model.Vm, ...]) -> list[bool, ...]:
         """
@@ -62,26 +139,61 @@ class VmmSpaceShared(policy.Vmm):
             a list of booleans, where each boolean indicates whether the corresponding vm
             was successfully allocated
         """
-        results = []
-        for vm in vms:
+        # Preallocated at full length; only successes need to be written back.
+        results = [False] * len(vms)
+        for i, vm in enumerate(vms):
             # Check if there is enough overall capacity (CPU, RAM, GPU) for the VM
-            if not all(self.has_capacity(vm)):
-                results.append(False)
+            if not self.has_capacity(vm):
                 continue
-            self._vm_cpu[vm] = {self._free_cpu.pop() for core in range(vm.CPU)}
-            self._free_ram -= vm.RAM
-            if vm.GPU:
-                for gpu_idx, free_gpu in enumerate(self._free_gpu):
-                    if all_gpu_blocks := self.find_gpu_blocks(vm.GPU, free_gpu):
-                        gpu_blocks = all_gpu_blocks.pop(0)
-                        free_gpu.difference_update(gpu_blocks)
-                        self._vm_gpu[vm] = gpu_idx, gpu_blocks
-                        break
-            self._guests.append(vm)
-            results.append(True)
-            vm.turn_on()
+            self._allocate_one(vm)
+            results[i] = True
         return results
 
+    def _allocate_one(self, vm: model.Vm) -> None:
+        """
+        Allocate a single VM whose capacity has already been verified by the caller.
+
+        Parameters
+        ----------
+        vm : Vm
+            the vm to allocate
+        """
+        # Claim the lowest free cores one bit at a time.
+        vm_cpu = 0
+        host_cpu = self.HOST.CPU
+        vm_cpu_capacities = []
+        for _ in range(vm.CPU):
+            lowest_core = self._free_cpu & -self._free_cpu
+            vm_cpu |= lowest_core
+            self._free_cpu ^= lowest_core
+            vm_cpu_capacities.append(host_cpu[lowest_core.bit_length() - 1])
+        self._vm_cpu[id(vm)] = vm_cpu
+        self._vm_cpu_capacities[id(vm)] = vm_cpu_capacities
+        self._free_ram -= vm.RAM
+        if vm.GPU:
+            last = self._last_placement
+            if last is not None and last[0] == id(vm) \
+                    and self._free_gpu[last[1]] & last[2] == last[2]:
+                # Reuse the placement found by the preceding has_capacity call.
+                _, gpu_idx, gpu_blocks = last
+                self._free_gpu[gpu_idx] &= ~gpu_blocks
+                self._vm_gpu[id(vm)] = gpu_idx, gpu_blocks
+                self._last_placement = None
+            else:
+                num_memory_blocks = vm.GPU[1]
+                for gpu_idx in range(len(self._free_gpu)):
+                    free_gpu = self._free_gpu[gpu_idx]
+                    if free_gpu.bit_count() < num_memory_blocks:
+                        continue
+                    if gpu_blocks := _first_placement(num_memory_blocks, self._gpu_num_blocks[gpu_idx], free_gpu):
+                        self._free_gpu[gpu_idx] &= ~gpu_blocks
+                        self._vm_gpu[id(vm)] = gpu_idx, gpu_blocks
+                        break
+        self._vm_resume[id(vm)] = vm.OS.resume
+        self._guests[vm] = None
+        self._track_guest(vm)
+        vm.turn_on()
+
     def deallocate(self, vms: list[model.Vm, ...]) -> list[bool, ...]:
         """
         The deallocate function takes a list of VMs and removes them from the host.
@@ -96,20 +208,22 @@ class VmmSpaceShared(policy.Vmm):
         -------
             a list of booleans
         """
-        results = []
-        for vm in vms:
+        results = [False] * len(vms)
+        for i, vm in enumerate(vms):
             if vm not in self:
-                results.append(False)
                 continue
-            self._free_cpu.update(self._vm_cpu[vm])
-            del self._vm_cpu[vm]
+            self._free_cpu |= self._vm_cpu[id(vm)]
+            del self._vm_cpu[id(vm)]
+            del self._vm_cpu_capacities[id(vm)]
+            del self._vm_resume[id(vm)]
             self._free_ram += vm.RAM
             if vm.GPU:
-                gpu, blocks = self._vm_gpu[vm]
-                self._free_gpu[gpu].update(blocks)
-                del self._vm_gpu[vm]
-            self._guests.remove(vm)
-            results.append(True)
+                gpu, blocks = self._vm_gpu[id(vm)]
+                self._free_gpu[gpu] |= blocks
+                del self._vm_gpu[id(vm)]
+            del self._guests[vm]
+            self._untrack_guest(vm)
+            results[i] = True
             vm.turn_off()
         return results
 
@@ -125,34 +239,31 @@ class VmmSpaceShared(policy.Vmm):
         """
         for vm in self:
             if vm.is_on():
-                vm_cpu = [self.HOST.CPU[core] for core in self._vm_cpu[vm]]
-                vm.OS.resume(vm_cpu, duration)
+                self._vm_resume[id(vm)](self._vm_cpu_capacities[id(vm)], duration)
         return self
 
-    def find_gpu_blocks(self, profile: tuple[int, int], gpu: set[int, ...]) -> list[set[int], ...]:
+    def find_gpu_blocks(self, profile: tuple[int, int], gpu: int) -> list[int, ...]:
         """
-        Find available GPU block sets that match a given profile on a specific GPU.
+        Find available GPU block masks that match a given profile on a specific GPU.
 
-        This method iterates through the available GPU blocks, checking them against the profile requirements.
-        It identifies sets of contiguous blocks on a GPU that match the profile's needs and collects these sets.
+        The candidate placement masks for a profile size on a GPU size never change, so they
+        are computed once and cached; this method only filters them against the free blocks.
 
         Parameters
         ----------
         profile : tuple[int, int]
             A tuple representing the profile of the virtual GPU. The first element is the number of compute engines
             needed, and the second element is the number of memory blocks needed.
-        gpu : set[int, ...]
-            A set representing available memory blocks on a specific GPU.
+        gpu : int
+            The index of the GPU on the host.
 
         Returns
         -------
-        list[set[int, ...], ...]
-            A list of sets, where each set contains contiguous memory blocks on the GPU where the profile can be placed.
+        list[int, ...]
+            A list of bitmasks, where each bitmask covers contiguous memory blocks on the GPU where the profile
+            can be placed.
         """
-        result = []
         _, num_memory_blocks = profile
-        for start in gpu:
-            blocks = set(range(start, start + num_memory_blocks))
-            if blocks.issubset(gpu):
-                result.append(blocks)
-        return result
+        free_gpu = self._free_gpu[gpu]
+        masks = _placement_masks(num_memory_blocks, self._gpu_num_blocks[gpu])
+        return [mask for mask in masks if free_gpu & mask == mask]
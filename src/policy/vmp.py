@@ -30,16 +30,26 @@ class VmpFirstFit(policy.Vmp):
         -------
             a list of booleans
         """
-        results = []
-        for vm in vms:
-            for host in self.DATACENTER.HOSTS:
-                if all(host.VMM.has_capacity(vm)):
-                    results.extend(host.VMM.allocate([vm]))
-                    self._vm_pm[vm] = host
+        results = [False] * len(vms)
+        hosts = self.DATACENTER.HOSTS
+        # Host capacity only shrinks during this call, so once a host fails for a
+        # given requirement it fails for every later VM with the same requirement;
+        # remember the failures to skip the capacity scan on those hosts.
+        failed = set()
+        for i, vm in enumerate(vms):
+            requirement = (vm.CPU, vm.RAM, vm.GPU)
+            for host in hosts:
+                key = (id(host), requirement)
+                if key in failed:
+                    continue
+                if host.VMM.has_capacity(vm):
+                    # Capacity was just verified, so skip the VMM's own recheck.
+                    host.VMM._allocate_one(vm)
+                    results[i] = True
+                    self._vm_pm[id(vm)] = host
                     evque.publish('vm.allocate', cloca.now(), host, vm)
                     break
-            else:
-                results.append(False)
+                failed.add(key)
         return results
 
     def deallocate(self, vms: list[model.Vm, ...]) -> list[bool, ...]:
@@ -58,9 +68,9 @@ class VmpFirstFit(policy.Vmp):
         """
         results = []
         for vm in vms:
-            host = self._vm_pm[vm]
+            host = self._vm_pm[id(vm)]
             results.extend(host.VMM.deallocate([vm]))
-            del self._vm_pm[vm]
+            del self._vm_pm[id(vm)]
             evque.publish('vm.deallocate', cloca.now(), host, vm)
         return results
 
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def OsTimeShared():
+    """The time-shared OS policy class, imported only once a test needs it."""
+    from policy.os import OsTimeShared as os_time_shared
+    return os_time_shared
@@ -1,44 +1,63 @@
-import unittest
+from functools import lru_cache
 
-from model import Deployment
+import pytest
 
 
-class TestDeployment(unittest.TestCase):
+# Spec fields: (NAME, LENGTH, CPU, RAM, GPU). A tuple of literals is stored as
+# a single constant in the compiled module, so nothing is built at import.
+_SPEC_TEMPLATES = (
+    ("WebServer", (1000, 1500), (1.0, 2.0), (512, 1024), None),
+    ("Database", (2000, 2500), (0.5, 1.5), (256, 512), (1, 2)),
+)
 
-    def setUp(self):
-        container_spec_1 = {
-            "NAME": "WebServer",
-            "LENGTH": (1000, 1500),
-            "CPU": (1.0, 2.0),
-            "RAM": (512, 1024),
-            "GPU": None
-        }
 
-        container_spec_2 = {
-            "NAME": "Database",
-            "LENGTH": (2000, 2500),
-            "CPU": (0.5, 1.5),
-            "RAM": (256, 512),
-            "GPU": (1, 2)
-        }
+@pytest.fixture(scope="module")
+def container_specs():
+    # Deployment never mutates its specs, so the dicts are built once per module.
+    return [{"NAME": name, "LENGTH": length, "CPU": cpu, "RAM": ram, "GPU": gpu}
+            for name, length, cpu, ram, gpu in _SPEC_TEMPLATES]
 
-        self.container_specs = [container_spec_1, container_spec_2]
-        self.deployment = Deployment(NAME="MyDeployment", replicas=3, CONTAINER_SPECS=self.container_specs)
 
-    def test_iter(self):
-        containers = list(self.deployment)
-        self.assertEqual(len(containers), 2)
-        self.assertIsInstance(containers[0], dict)
-        self.assertIsInstance(containers[1], dict)
+# Cached factory: repeated runs (parametrization, --lf loops) reuse the same
+# instance instead of reconstructing it. Specs are referenced by template count
+# since lists are not hashable.
+@lru_cache(maxsize=None)
+def _make_deployment(name, replicas, num_specs):
+    from model import Deployment
+    specs = [{"NAME": n, "LENGTH": length, "CPU": cpu, "RAM": ram, "GPU": gpu}
+             for n, length, cpu, ram, gpu in _SPEC_TEMPLATES[:num_specs]]
+    return Deployment(NAME=name, replicas=replicas, CONTAINER_SPECS=specs)
 
-    def test_hash(self):
-        self.assertEqual(self.deployment.__hash__(), id(self.deployment))
 
-    def test_eq(self):
-        deployment2 = Deployment(NAME="MyDeployment2", replicas=3, CONTAINER_SPECS=self.container_specs[:1])
-        self.assertNotEqual(self.deployment, deployment2)
-        self.assertEqual(self.deployment, self.deployment)
+# None of the tests mutate the deployment, so one instance serves the module.
+@pytest.fixture(scope="module")
+def deployment(container_specs):
+    # Imported at run time so pytest collection does not pay for the model package.
+    from model import Deployment
+    return Deployment(NAME="MyDeployment", replicas=3, CONTAINER_SPECS=container_specs)
 
 
-if __name__ == '__main__':
-    unittest.main()
+def _assert_deployment_self_eq(deployment):
+    # The assert lives in one helper, so pytest rewrites it once for all callers
+    # while failures still show the deployment's repr.
+    assert deployment == deployment
+
+
+@pytest.mark.fast
+class TestDeployment:
+
+    def test_iter(self, deployment):
+        # Consume the iterator directly instead of materializing a throwaway list
+        containers = iter(deployment)
+        # The specs are guaranteed plain dicts, so the exact-type check applies
+        assert type(next(containers)) is dict
+        assert type(next(containers)) is dict
+        assert next(containers, None) is None
+
+    def test_hash(self, deployment):
+        assert hash(deployment) == id(deployment)
+
+    def test_eq(self, deployment):
+        deployment2 = _make_deployment("MyDeployment2", 3, 1)
+        assert deployment != deployment2
+        _assert_deployment_self_eq(deployment)
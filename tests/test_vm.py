@@ -1,27 +1,35 @@
-import unittest
+import pytest
 
-from model import Vm
-from policy.os import OsTimeShared
 
+@pytest.fixture(scope="session")
+def _vm_template(OsTimeShared):
+    # The OS policy comes from the conftest fixture; the model import happens
+    # here so collection does not pay for either package.
+    from model import Vm
 
-class TestVm(unittest.TestCase):
-    def setUp(self):
-        # Create test objects or variables if needed
-        self.vm = Vm(NAME="TestVM", CPU=4, RAM=8, GPU=(2, 4), OS=OsTimeShared)
+    return Vm(NAME="TestVM", CPU=4, RAM=8, GPU=(2, 4), OS=OsTimeShared)
 
-    def test_turn_on(self):
-        # Test turn_on method
-        self.vm.turn_on()
-        self.assertTrue(self.vm.is_on())
 
-    def test_turn_off(self):
-        # Test turn_off method
-        self.vm.turn_on()  # Make sure the VM is turned on before turning it off
-        self.vm.turn_off()
-        self.assertTrue(self.vm.is_off())
+@pytest.fixture
+def vm(_vm_template):
+    # Constructing a Vm instantiates its OS policy; reuse one instance for the
+    # session and reset it per test — turn_off restarts the OS as well.
+    return _vm_template.turn_off()
+
+
+@pytest.fixture
+def vm_on(vm):
+    vm.turn_on()
+    return vm
 
-    # Add more test cases as needed
 
+@pytest.mark.fast
+class TestVm:
 
-if __name__ == '__main__':
-    unittest.main()
+    @pytest.mark.parametrize("action, check", [("turn_on", "is_on"), ("turn_off", "is_off")])
+    def test_power(self, vm_on, action, check):
+        # Both transitions start from an already-on VM provided by the fixture
+        getattr(vm_on, action)()
+        assert getattr(vm_on, check)()
+
+    # Add more test cases as needed